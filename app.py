@@ -2,11 +2,15 @@
 app.py
 """
 
+import io
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
-from calculations import generate_monthly_projections, apply_scenario_adjustments
+from types import MappingProxyType
+from calculations import (generate_monthly_projections, apply_scenario_adjustments, project_grid,
+                          calculate_monthly_payment)
 from templates import get_example_templates
 
 st.set_page_config(page_title="Cash Flow Lab", page_icon="💰", layout="wide")
@@ -14,6 +18,92 @@ st.set_page_config(page_title="Cash Flow Lab", page_icon="💰", layout="wide")
 # Debug mode flag (set False for deployment)
 DEBUG_DEFAULT = False
 
+# Chart colors and display labels per scenario key (growth label is built at runtime)
+_SCENARIO_COLORS = MappingProxyType({
+    'base': '#1f77b4', 'aggressive': '#2ca02c', 'conservative': '#ff7f0e',
+    'custom': '#9467bd', 'growth': '#d62728', 'delay': '#8c564b',
+    'inflation': '#e377c2', 'excess_inv': '#7f7f7f', 'stagnant': '#bcbd22',
+    'higher_debt': '#e377c2', 'growth_debt': '#d62728'
+})
+
+_SCENARIO_LABELS = MappingProxyType({
+    'base': 'Base', 'aggressive': 'Aggressive WC', 'conservative': 'Conservative WC',
+    'custom': 'Custom WC', 'delay': 'Payment Delays',
+    'inflation': 'Cost Inflation', 'excess_inv': 'Excess Inventory',
+    'stagnant': 'Stagnant Revenue', 'higher_debt': 'Higher Debt (+50%)',
+    'growth_debt': 'Growth + Debt (5%/mo)'
+})
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_projections(inputs_tuple, num_months, debt_tuple):
+    """Projections keyed by hashable (key, value) tuples so reruns reuse results."""
+    return generate_monthly_projections(dict(inputs_tuple), num_months,
+                                        dict(debt_tuple) if debt_tuple else None)
+
+
+def _projections(inputs, num_months, debt_params=None):
+    """Cached equivalent of generate_monthly_projections for dict inputs."""
+    debt_tuple = tuple(sorted(debt_params.items())) if debt_params else None
+    return _cached_projections(tuple(sorted(inputs.items())), num_months, debt_tuple)
+
+
+def _base_projection(inputs, num_months, debt_params=None):
+    """Base projections, reused from session state while inputs are unchanged."""
+    key = (tuple(sorted(inputs.items())), num_months, tuple(sorted((debt_params or {}).items())))
+    if st.session_state.get('_base_key') != key:
+        st.session_state['_base_df'] = _projections(inputs, num_months, debt_params)
+        st.session_state['_base_key'] = key
+    return st.session_state['_base_df']
+
+
+def _project(base_inputs, num_months, debt_params=None, **overrides):
+    """Cached projections for base_inputs with keyword overrides merged in."""
+    return _projections({**base_inputs, **overrides}, num_months, debt_params)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_grid(inputs_tuple, num_months, rates_tuple, debt_tuple):
+    """Cash balance grid over growth rates, keyed like _cached_projections."""
+    return project_grid(dict(inputs_tuple), num_months, np.array(rates_tuple),
+                        dict(debt_tuple) if debt_tuple else None)
+
+
+def _growth_grid(inputs, num_months, rates, debt_params=None):
+    """Cached equivalent of project_grid for dict inputs."""
+    debt_tuple = tuple(sorted(debt_params.items())) if debt_params else None
+    return _cached_grid(tuple(sorted(inputs.items())), num_months, tuple(rates), debt_tuple)
+
+
+def _derived(cogs_pct, ar_days, ap_days, inventory_days):
+    """Derived display metrics: (CCC days, gross margin %)."""
+    return ar_days + inventory_days - ap_days, (1 - cogs_pct) * 100
+
+
+# Loan size multipliers in use: the sidebar loan (1.0) and the Higher Debt scenario (1.5)
+_LOAN_MULTIPLIERS = (1.0, 1.5)
+
+
+@st.cache_data(show_spinner=False)
+def _monthly_payments(amount, annual_rate, months):
+    """Amortized payment for each loan multiplier, computed in one pass."""
+    payments = calculate_monthly_payment(amount * np.array(_LOAN_MULTIPLIERS), annual_rate, months)
+    return dict(zip(_LOAN_MULTIPLIERS, payments.tolist()))
+
+
+def _summarize(scenarios):
+    """Per-scenario aggregates shared by the results sections."""
+    return {
+        name: {
+            'first': df.iloc[0],
+            'final': df.iloc[-1],
+            'fcf_sum': float(df['fcf'].to_numpy().sum()),
+            'dscr_sum': float(df['dscr'].to_numpy().sum()),
+            'delta_wc_std': float(df['delta_wc'].to_numpy().std(ddof=1))
+        }
+        for name, df in scenarios.items()
+    }
+
 
 def main():
     render_header()
@@ -22,23 +112,24 @@ def main():
     
     if st.session_state.get('inputs_ready', False):
         # Generate base scenario
-        base = generate_monthly_projections(
+        base = _base_projection(
             st.session_state['user_inputs'],
             st.session_state['num_months'],
             st.session_state.get('debt_params')
         )
         
         # Show base business summary 
-        render_base_summary()
+        render_base_summary(base)
         
         # Scenario Lab - one type at a time
         scenarios = {'base': base}
         scenarios = render_scenario_lab(scenarios)
         
-        # Show results
-        render_scenario_comparison(scenarios)
-        render_visualizations(scenarios)
-        render_wc_breakdown(scenarios)
+        # Show results (per-scenario aggregates computed once)
+        summary = _summarize(scenarios)
+        render_scenario_comparison(scenarios, summary)
+        render_visualizations(scenarios, summary)
+        render_wc_breakdown(scenarios, summary)
         render_explore_more()
         render_export(scenarios)
         
@@ -51,37 +142,38 @@ def main():
         st.info("👈 Select a template in sidebar to start")
 
 
-def render_feedback_and_support():
-    """Feedback form and Buy Me a Coffee."""
-    st.markdown("---")
-    
-    # Feedback form
-    st.markdown("""
+# Static HTML blocks (built once at import, not on every rerun)
+_FEEDBACK_HTML = """
 <div style="background: #e3f2fd; border-radius: 8px; padding: 20px; margin: 20px 0; text-align: center;">
     <p style="color: #1565c0; font-size: 16px; font-weight: 600; margin: 0 0 12px 0;">✨ Share Feedback or Request Assistance</p>
     <a href="https://docs.google.com/forms/d/e/1FAIpQLSd7E0Vg3lD5SzrCbcJ7INpaMVX-Ad3WdSlgmiY-G8wXyBNymw/viewform?usp=header" rel="noopener" style="display: inline-block; background: #1565c0; color: white; padding: 10px 25px; border-radius: 5px; text-decoration: none; font-weight: 600; font-size: 13px;">
         Contact Us
     </a>
 </div>
-""", unsafe_allow_html=True)
-    
-    # Buy Me a Coffee
-    st.markdown("""
+"""
+
+_SUPPORT_HTML = """
 <div style="text-align: center; padding: 20px; background: #f8f9fa; border-radius: 5px; margin: 20px 0;">
     <p style="margin: 0 0 10px 0; font-size: 16px;">☕ <strong> Support this project and future work </strong></p>
     <a href="https://www.buymeacoffee.com/flourishingperspectivehub" target="_blank" rel="noopener">
         <img src="https://cdn.buymeacoffee.com/buttons/v2/default-yellow.png" alt="Buy Me A Coffee" style="height: 40px;">
     </a>
 </div>
-""", unsafe_allow_html=True)
+"""
 
 
-def render_legal_disclaimer():
-    """Legal and privacy information."""
+def render_feedback_and_support():
+    """Feedback form and Buy Me a Coffee."""
     st.markdown("---")
     
-    with st.expander("⚖️ Legal & Privacy Information"):
-        st.markdown("""
+    # Feedback form
+    st.markdown(_FEEDBACK_HTML, unsafe_allow_html=True)
+    
+    # Buy Me a Coffee
+    st.markdown(_SUPPORT_HTML, unsafe_allow_html=True)
+
+
+_DISCLAIMER_MD = """
 **Educational Simulator**
 
 Best practice: **Assume all results may be inaccurate.** This tool demonstrates financial concepts through simplified models, not real-world predictions.
@@ -153,7 +245,15 @@ By using this tool, you agree to these terms:
 **Email:** FlourishingPerspectiveHub [AT] gmail [DOT] com
 
 For questions about this tool, please contact us at the email above or use the feedback form. 
-""")
+"""
+
+
+def render_legal_disclaimer():
+    """Legal and privacy information."""
+    st.markdown("---")
+    
+    with st.expander("⚖️ Legal & Privacy Information"):
+        st.markdown(_DISCLAIMER_MD)
     
     st.markdown("---")
     st.caption("💰 Cash Flow Lab | Free educational tool — explore, plan, and learn. Always verify all calculations.")
@@ -181,15 +281,7 @@ Explore concepts like the growth paradox and working capital cycles through inte
 
 
 
-def render_financial_concepts():
-    """Educational foundation."""
-    with st.expander("📚 Financial Concepts Reference", expanded=False):
-        tab1, tab2, tab3, tab4, tab5 = st.tabs(["Core Metrics", "Growth Paradox", "Operational Risks", "Advanced", "Definitions"])
-        
-        with tab1:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("""
+_CORE_METRICS_MD = """
                 **Gross Margin**  
                 `(Revenue - COGS) / Revenue × 100%`
                 
@@ -223,10 +315,9 @@ def render_financial_concepts():
                 Operating profit before financing costs.
                 - Shows business performance
                 - Ignores debt structure
-                """)
-            
-            with col2:
-                st.markdown("""
+                """
+
+_CORE_FLOWS_MD = """
                 **Working Capital (WC)**  
                 `(AR + Inventory) - AP`
                 
@@ -264,10 +355,9 @@ def render_financial_concepts():
                 - The ultimate measure of financial health
                 
                 💡 **Key**: Profit ≠ Cash. ΔWC bridges the gap.
-                """)
-        
-        with tab2:
-            st.markdown("""
+                """
+
+_GROWTH_PARADOX_MD = """
             ### Growth Paradox
             
             **You can be profitable but run out of cash!**
@@ -302,10 +392,9 @@ def render_financial_concepts():
             Max growth your cash supports. Beyond = need funding.
             
             💡 **See**: Max Sustainable Growth chart
-            """)
-        
-        with tab3:
-            st.markdown("""
+            """
+
+_OPERATIONAL_RISKS_MD = """
             **Working Capital Trap**: Revenue flat, AR/Inventory rises → cash drain  
             💡 Test: Stagnant Revenue
             
@@ -324,10 +413,9 @@ def render_financial_concepts():
             - Higher COGS = lower Gross Margin
             - Same revenue, less profit, more cash needed
             💡 Test: Cost Inflation (+2%/mo)
-            """)
-        
-        with tab4:
-            st.markdown("""
+            """
+
+_ADVANCED_MD = """
             **CapEx Cliff**: Large equipment purchase → FCF drops  
             💡 See: EBIT to FCF waterfall
             
@@ -355,24 +443,51 @@ def render_financial_concepts():
             💡 Test: Higher Debt scenario  
             💡 See: DSCR chart
     
-            """)
-        
-        with tab5:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("""
+            """
+
+_DEFINITIONS_DAYS_MD = """
                 **AR Days**: Customer payment time  
                 **AP Days**: Supplier payment time  
                 **Inventory Days**: Stock holding time  
                 **CCC**: Cash tied up duration
-                """)
-            with col2:
-                st.markdown("""
+                """
+
+_DEFINITIONS_TERMS_MD = """
                 **COGS**: Cost of Goods Sold  
                 **OPEX**: Operating Expenses  
                 **CapEx**: Capital Expenditures  
                 **FCF**: Free Cash Flow
-                """)
+                """
+
+
+def render_financial_concepts():
+    """Educational foundation."""
+    with st.expander("📚 Financial Concepts Reference", expanded=False):
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["Core Metrics", "Growth Paradox", "Operational Risks", "Advanced", "Definitions"])
+        
+        with tab1:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(_CORE_METRICS_MD)
+            
+            with col2:
+                st.markdown(_CORE_FLOWS_MD)
+        
+        with tab2:
+            st.markdown(_GROWTH_PARADOX_MD)
+        
+        with tab3:
+            st.markdown(_OPERATIONAL_RISKS_MD)
+        
+        with tab4:
+            st.markdown(_ADVANCED_MD)
+        
+        with tab5:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(_DEFINITIONS_DAYS_MD)
+            with col2:
+                st.markdown(_DEFINITIONS_TERMS_MD)
 
 
 def render_sidebar():
@@ -404,93 +519,94 @@ def render_sidebar():
 
     st.sidebar.markdown("---")
     
-    # Business Fundamentals
-    st.sidebar.subheader("💼 Business Fundamentals")
-    
-    num_months = st.sidebar.number_input(
-        "Projection period (months)", 3, 36,
-        st.session_state.get('months', 12), 1
-    )
-    
-    opening_cash = st.sidebar.number_input(
-        "Opening Cash ($)", 0, 10000000,
-        st.session_state.get('cash', 100000), 10000
-    )
-    
-    revenue = st.sidebar.number_input(
-        "Monthly Revenue ($)", 0, 10000000,
-        st.session_state.get('rev', 100000), 10000
-    )
-    
-    cogs_pct = st.sidebar.slider(
-        "COGS (% of revenue)", 0, 100,
-        st.session_state.get('cogs', 60), 5
-    ) / 100
-    st.sidebar.caption(f"Gross Margin: {(1-cogs_pct)*100:.0f}%")
-    
-    opex = st.sidebar.number_input(
-        "Monthly OPEX ($)", 0, 1000000,
-        st.session_state.get('opex', 20000), 5000
-    )
-    
-    # Working Capital Terms (from template)
-    st.sidebar.subheader("🔄 Working Capital Terms")
-    st.sidebar.caption("From template - adjust in scenarios")
-    
-    ar_days = st.session_state.get('ar', 45)
-    ap_days = st.session_state.get('ap', 30)
-    inv_days = st.session_state.get('inv', 60)
-    
-    ccc = ar_days + inv_days - ap_days
-    st.sidebar.metric("Cash Conversion Cycle", f"{ccc} days")
-    st.sidebar.caption(f"AR: {ar_days}d | AP: {ap_days}d | Inv: {inv_days}d")
-    
-    # Advanced Settings
-    with st.sidebar.expander("⚙️ Advanced Settings"):
-        tax_rate = st.slider("Tax Rate (%)", 0, 50, 
-                            st.session_state.get('tax', 25), 5) / 100
+    # Setup inputs are batched in a form so edits rerun the app once, on Apply
+    with st.sidebar.form("setup"):
+        # Business Fundamentals
+        st.subheader("💼 Business Fundamentals")
+        
+        num_months = st.number_input(
+            "Projection period (months)", 3, 36,
+            st.session_state.get('months', 12), 1
+        )
         
-        capex = st.number_input("Monthly CapEx ($)", 0, 500000,
-                               st.session_state.get('capex_val', 5000), 1000)
+        opening_cash = st.number_input(
+            "Opening Cash ($)", 0, 10000000,
+            st.session_state.get('cash', 100000), 10000
+        )
         
-        depreciation = st.number_input("Monthly Depreciation ($)", 0, 500000,
-                                      st.session_state.get('depr_val', 4000), 1000)
+        revenue = st.number_input(
+            "Monthly Revenue ($)", 0, 10000000,
+            st.session_state.get('rev', 100000), 10000
+        )
         
-        # Base growth rate
-        base_growth = st.slider("Base Growth Rate (%/mo)", 0.0, 5.0,
-                               st.session_state.get('growth_val', 2.0), 0.5) / 100
-        st.caption("Revenue growth in Base scenario")
-    
-    # Debt (from template)
-    with st.sidebar.expander("💳 Debt Settings"):
+        cogs_pct = st.slider(
+            "COGS (% of revenue)", 0, 100,
+            st.session_state.get('cogs', 60), 5
+        ) / 100
+        
+        # Working capital terms come from the template, not widgets
+        ar_days = st.session_state.get('ar', 45)
+        ap_days = st.session_state.get('ap', 30)
+        inv_days = st.session_state.get('inv', 60)
+        ccc, gm_pct = _derived(cogs_pct, ar_days, ap_days, inv_days)
+        
+        opex = st.number_input(
+            "Monthly OPEX ($)", 0, 1000000,
+            st.session_state.get('opex', 20000), 5000
+        )
+        
+        # Working Capital Terms (from template)
+        st.subheader("🔄 Working Capital Terms")
         st.caption("From template - adjust in scenarios")
         
-        has_term = st.checkbox("Term Loan",
-                              value=st.session_state.get('has_term', False))
-        if has_term:
+        st.metric("Cash Conversion Cycle", f"{ccc} days")
+        st.caption(f"AR: {ar_days}d | AP: {ap_days}d | Inv: {inv_days}d")
+        
+        # Advanced Settings
+        with st.expander("⚙️ Advanced Settings"):
+            tax_rate = st.slider("Tax Rate (%)", 0, 50, 
+                                st.session_state.get('tax', 25), 5) / 100
+            
+            capex = st.number_input("Monthly CapEx ($)", 0, 500000,
+                                   st.session_state.get('capex_val', 5000), 1000)
+            
+            depreciation = st.number_input("Monthly Depreciation ($)", 0, 500000,
+                                          st.session_state.get('depr_val', 4000), 1000)
+            
+            # Base growth rate
+            base_growth = st.slider("Base Growth Rate (%/mo)", 0.0, 5.0,
+                                   st.session_state.get('growth_val', 2.0), 0.5) / 100
+            st.caption("Revenue growth in Base scenario")
+        
+        # Debt (from template)
+        with st.expander("💳 Debt Settings"):
+            st.caption("From template - adjust in scenarios")
+            
+            has_term = st.checkbox("Term Loan",
+                                  value=st.session_state.get('has_term', False))
+            # Always shown: inside the form the checkbox can't reveal fields before Apply
             term_amount = st.number_input("Loan Amount ($)", 0, 10000000,
                                          st.session_state.get('term_amount', 100000), 10000)
             term_rate = st.slider("Interest Rate (%)", 0.0, 15.0, 
                                  st.session_state.get('term_rate', 6.0), 0.5) / 100
             term_months = st.number_input("Term (months)", 12, 360, 
                                          st.session_state.get('term_months', 60), 12)
-            
-            # Calculate monthly payment (handle 0% interest)
-            monthly_rate = term_rate / 12
-            if monthly_rate > 0:
-                monthly_payment = term_amount * (monthly_rate * (1 + monthly_rate)**term_months) / ((1 + monthly_rate)**term_months - 1)
-            else:
-                monthly_payment = term_amount / term_months
-            
-            debt_params = {
-                'loan_amount': term_amount,
-                'interest_rate': term_rate,
-                'term_months': term_months,
-                'monthly_payment': monthly_payment
-            }
-            st.caption(f"Monthly Payment: ${monthly_payment:,.0f}")
-        else:
-            debt_params = None
+        
+        submitted = st.form_submit_button("Apply", width="stretch")
+    
+    # Derived values follow the applied inputs, so they are shown outside the form
+    st.sidebar.caption(f"Gross Margin: {gm_pct:.0f}%")
+    if has_term:
+        monthly_payment = _monthly_payments(term_amount, term_rate, term_months)[1.0]
+        debt_params = {
+            'loan_amount': term_amount,
+            'interest_rate': term_rate,
+            'term_months': term_months,
+            'monthly_payment': monthly_payment
+        }
+        st.sidebar.caption(f"Monthly Payment: ${monthly_payment:,.0f}")
+    else:
+        debt_params = None
     
     # Debug Mode
     # Only show debug toggle if DEBUG_DEFAULT is True (for development)
@@ -519,39 +635,43 @@ def render_sidebar():
     }
     st.session_state['num_months'] = num_months
     st.session_state['debt_params'] = debt_params
-    st.session_state['inputs_ready'] = True
+    if submitted:
+        st.session_state['inputs_ready'] = True
+
+
+# Template field -> session_state key (values copied as-is)
+_TEMPLATE_STATE_KEYS = {
+    'ar_days': 'ar', 'ap_days': 'ap', 'inventory_days': 'inv',
+    'num_months': 'months', 'opening_cash': 'cash', 'revenue': 'rev',
+    'opex': 'opex', 'capex': 'capex_val', 'depreciation': 'depr_val',
+    'has_term': 'has_term', 'term_amount': 'term_amount', 'term_months': 'term_months'
+}
+
+# Template fields stored as percentages -> (session_state key, widget value)
+_TEMPLATE_TRANSFORMS = {
+    'cogs_pct': lambda v: ('cogs', int(v * 100)),  # Store as INT percentage
+    'tax_rate': lambda v: ('tax', int(v * 100)),  # Store as INT percentage
+    'price_increase': lambda v: ('growth_val', v * 100),
+    'term_rate': lambda v: ('term_rate', v * 100)
+}
 
 
 def load_template(template):
     """Load template into session state."""
-    mapping = {
-        'ar_days': 'ar', 'ap_days': 'ap', 'inventory_days': 'inv',
-        'num_months': 'months', 'opening_cash': 'cash', 'revenue': 'rev',
-        'opex': 'opex', 'capex': 'capex_val', 'depreciation': 'depr_val'
-    }
-    
     for key, val in template.items():
-        if key == 'cogs_pct':
-            st.session_state['cogs'] = int(val * 100)
-        elif key == 'tax_rate':
-            st.session_state['tax'] = int(val * 100)  # Store as INT percentage
-        elif key == 'price_increase':
-            st.session_state['growth_val'] = val * 100  # Store as percentage
-        elif key == 'has_term':
-            st.session_state['has_term'] = val
-        elif key == 'term_amount':
-            st.session_state['term_amount'] = val
-        elif key == 'term_rate':
-            st.session_state['term_rate'] = val * 100  # Store as percentage
-        elif key == 'term_months':
-            st.session_state['term_months'] = val
-        elif key in mapping:
-            st.session_state[mapping[key]] = val
+        if key in _TEMPLATE_TRANSFORMS:
+            state_key, state_val = _TEMPLATE_TRANSFORMS[key](val)
+        else:
+            state_key, state_val = _TEMPLATE_STATE_KEYS.get(key), val
+        if state_key:
+            st.session_state[state_key] = state_val
     
+    # Templates apply immediately, without waiting for the setup form
+    st.session_state['inputs_ready'] = True
     st.rerun()
 
 
-def render_base_summary():
+def render_base_summary(base):
     """Show base business with key metrics."""
     st.markdown("---")
     st.subheader("📊 Your Base Business")
@@ -559,19 +679,12 @@ def render_base_summary():
     inputs = st.session_state['user_inputs']
     debt_params = st.session_state.get('debt_params')
     
-    # Generate base scenario to get metrics
-    base = generate_monthly_projections(
-        inputs,
-        st.session_state['num_months'],
-        debt_params
-    )
-    
     ar = inputs['ar_days']
     ap = inputs['ap_days']
     inv = inputs['inventory_days']
-    ccc = ar + inv - ap
-    final_cash = base['cash_balance'].iloc[-1]
-    total_fcf = base['fcf'].sum()
+    ccc, _ = _derived(inputs['cogs_pct'], ar, ap, inv)
+    final_cash = base['cash_balance'].to_numpy()[-1]
+    total_fcf = base['fcf'].to_numpy().sum()
     
     # 5 metrics in one row
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -702,48 +815,26 @@ def render_wc_scenarios(scenarios, base_inputs, num_months, debt_params):
     st.markdown("---")
     st.markdown("**Scenario Comparison:**")
     
-    scenario_data = []
-    scenario_data.append({
-        'Scenario': 'Base',
-        'AR Days': ar,
-        'AP Days': ap,
-        'Inv Days': inv,
-        'CCC': ar + inv - ap
-    })
-    
-    scenario_data.append({
-        'Scenario': '✅ Aggressive',
-        'AR Days': agg_ar,
-        'AP Days': agg_ap,
-        'Inv Days': agg_inv,
-        'CCC': agg_ar + agg_inv - agg_ap
-    })
-    
-    scenario_data.append({
-        'Scenario': '⚠️ Conservative',
-        'AR Days': cons_ar,
-        'AP Days': cons_ap,
-        'Inv Days': cons_inv,
-        'CCC': cons_ar + cons_inv - cons_ap
+    st.table({
+        'Scenario': ['Base', '✅ Aggressive', '⚠️ Conservative'],
+        'AR Days': [ar, agg_ar, cons_ar],
+        'AP Days': [ap, agg_ap, cons_ap],
+        'Inv Days': [inv, agg_inv, cons_inv],
+        'CCC': [ar + inv - ap, agg_ar + agg_inv - agg_ap, cons_ar + cons_inv - cons_ap]
     })
     
-    st.dataframe(pd.DataFrame(scenario_data), hide_index=True, width="stretch")
-    
     # Generate scenarios
     if show_agg:
-        agg_inputs = base_inputs.copy()
-        agg_inputs.update({'ar_days': agg_ar, 'ap_days': agg_ap, 'inventory_days': agg_inv})
-        scenarios['aggressive'] = generate_monthly_projections(agg_inputs, num_months, debt_params)
+        scenarios['aggressive'] = _project(base_inputs, num_months, debt_params,
+                                           ar_days=agg_ar, ap_days=agg_ap, inventory_days=agg_inv)
     
     if show_cons:
-        cons_inputs = base_inputs.copy()
-        cons_inputs.update({'ar_days': cons_ar, 'ap_days': cons_ap, 'inventory_days': cons_inv})
-        scenarios['conservative'] = generate_monthly_projections(cons_inputs, num_months, debt_params)
+        scenarios['conservative'] = _project(base_inputs, num_months, debt_params,
+                                             ar_days=cons_ar, ap_days=cons_ap, inventory_days=cons_inv)
     
     if show_custom:
-        custom_inputs = base_inputs.copy()
-        custom_inputs.update({'ar_days': custom_ar, 'ap_days': custom_ap, 'inventory_days': custom_inv})
-        scenarios['custom'] = generate_monthly_projections(custom_inputs, num_months, debt_params)
+        scenarios['custom'] = _project(base_inputs, num_months, debt_params,
+                                       ar_days=custom_ar, ap_days=custom_ap, inventory_days=custom_inv)
     
     return scenarios
 
@@ -764,14 +855,15 @@ def render_growth_scenarios(scenarios, base_inputs, num_months, debt_params):
     # Store selected growth rate
     st.session_state['selected_growth_rate'] = growth_rate
     
-    growth_inputs = base_inputs.copy()
-    growth_inputs['price_increase'] = growth_val
-    scenarios['growth'] = generate_monthly_projections(growth_inputs, num_months, debt_params)
+    scenarios['growth'] = _project(base_inputs, num_months, debt_params, price_increase=growth_val)
     
     # Learning moment
-    growth_cash = scenarios['growth']['cash_balance'].min()
-    if growth_cash < 0:
-        deficit_month = scenarios['growth'][scenarios['growth']['cash_balance'] < 0].iloc[0]['month']
+    cash = scenarios['growth']['cash_balance'].to_numpy()
+    month = scenarios['growth']['month'].to_numpy()
+    neg = cash < 0
+    growth_cash = cash.min()
+    if neg.any():
+        deficit_month = month[neg.argmax()]
         st.error(f"🚨 **Learning Moment**: At {growth_val*100:.0f}% growth, cash goes negative by Month {deficit_month:.0f}!")
         st.caption(f"Need ${abs(growth_cash):,.0f} funding. Growth ties up cash in AR/Inventory.")
     else:
@@ -781,24 +873,17 @@ def render_growth_scenarios(scenarios, base_inputs, num_months, debt_params):
     st.markdown("---")
     st.markdown("### 📈 Max Sustainable Growth & Cash Runway")
     
-    test_rates = [0.00, 0.02, 0.03, 0.04, 0.05, 0.06, 0.08, 0.10, 0.12, 0.15]
-    max_sustainable = 0
-    runway_data = []
+    test_rates = np.array([0.00, 0.02, 0.03, 0.04, 0.05, 0.06, 0.08, 0.10, 0.12, 0.15])
     
-    for rate in test_rates:
-        test_inputs = base_inputs.copy()
-        test_inputs['price_increase'] = rate
-        test_df = generate_monthly_projections(test_inputs, num_months, debt_params)
-        min_cash = test_df['cash_balance'].min()
-        
-        if min_cash >= 0:
-            max_sustainable = rate
-            runway_months = num_months
-        else:
-            deficit_month = test_df[test_df['cash_balance'] < 0].iloc[0]['month']
-            runway_months = int(deficit_month) - 1
-        
-        runway_data.append({'rate': rate, 'runway_months': runway_months})
+    # One row of monthly cash balances per rate (column index = month).
+    # Whether growth raises or lowers min cash depends on the CCC sign (negative-CCC
+    # businesses release cash as they grow), so no single bisection direction fits;
+    # the vectorized grid already evaluates every rate in one call.
+    cash_grid = _growth_grid(base_inputs, num_months, test_rates, debt_params)
+    sustainable = cash_grid.min(axis=1) >= 0
+    max_sustainable = test_rates[sustainable][-1] if sustainable.any() else 0
+    deficit_month = (cash_grid < 0).argmax(axis=1)
+    runway_months = np.where(sustainable, num_months, deficit_month - 1)
     
     col1, col2 = st.columns([1, 2])
     
@@ -809,9 +894,9 @@ def render_growth_scenarios(scenarios, base_inputs, num_months, debt_params):
     with col2:
         fig_runway = go.Figure()
         
-        fig_runway.add_trace(go.Scatter(
-            x=[d['rate']*100 for d in runway_data],
-            y=[d['runway_months'] for d in runway_data],
+        fig_runway.add_trace(go.Scattergl(
+            x=test_rates*100,
+            y=runway_months,
             mode='lines+markers',
             line=dict(color='#3498DB', width=3),
             marker=dict(size=8)
@@ -841,49 +926,43 @@ def render_risk_scenarios(scenarios, base_inputs, num_months, debt_params):
     with col1:
         test_delay = st.checkbox("📅 Payment Delays (+15d AR)")
         if test_delay:
-            delay_inputs = base_inputs.copy()
-            delay_inputs['ar_days'] = base_inputs['ar_days'] + 15
-            scenarios['delay'] = generate_monthly_projections(delay_inputs, num_months, debt_params)
+            scenarios['delay'] = _project(base_inputs, num_months, debt_params,
+                                          ar_days=base_inputs['ar_days'] + 15)
             
-            cash_impact = scenarios['delay']['cash_balance'].iloc[-1] - scenarios['base']['cash_balance'].iloc[-1]
+            cash_impact = scenarios['delay']['cash_balance'].to_numpy()[-1] - scenarios['base']['cash_balance'].to_numpy()[-1]
             st.caption(f"Impact: ${cash_impact:,.0f}")
         
         test_inflation = st.checkbox("📈 Cost Inflation (+2%/mo COGS)")
         if test_inflation:
-            inflation_inputs = base_inputs.copy()
-            inflation_inputs['cogs_increase'] = 0.02
-            scenarios['inflation'] = generate_monthly_projections(inflation_inputs, num_months, debt_params)
+            scenarios['inflation'] = _project(base_inputs, num_months, debt_params, cogs_increase=0.02)
             
-            margin_end = scenarios['inflation']['gross_margin'].iloc[-1]
+            margin_end = scenarios['inflation']['gross_margin'].to_numpy()[-1]
             margin_start = (1 - base_inputs['cogs_pct']) * 100
             st.caption(f"Margin: {margin_start:.0f}% → {margin_end:.0f}%")
             
             # Check if COGS cap was hit
-            final_cogs_pct = scenarios['inflation']['cogs'].iloc[-1] / scenarios['inflation']['revenue'].iloc[-1]
+            final_cogs_pct = scenarios['inflation']['cogs'].to_numpy()[-1] / scenarios['inflation']['revenue'].to_numpy()[-1]
             if final_cogs_pct >= 0.94:
                 st.warning("⚠️ COGS capped at 95%")
     
     with col2:
         test_inv = st.checkbox("📦 Inventory Buildup (+20%)")
         if test_inv:
-            inv_inputs = base_inputs.copy()
-            inv_inputs['inventory_days'] = int(base_inputs['inventory_days'] * 1.2)
-            scenarios['excess_inv'] = generate_monthly_projections(inv_inputs, num_months, debt_params)
+            new_inv_days = int(base_inputs['inventory_days'] * 1.2)
+            scenarios['excess_inv'] = _project(base_inputs, num_months, debt_params,
+                                               inventory_days=new_inv_days)
             
-            cash_impact = scenarios['excess_inv']['cash_balance'].iloc[-1] - scenarios['base']['cash_balance'].iloc[-1]
+            cash_impact = scenarios['excess_inv']['cash_balance'].to_numpy()[-1] - scenarios['base']['cash_balance'].to_numpy()[-1]
             base_inv_days = base_inputs['inventory_days']
-            new_inv_days = inv_inputs['inventory_days']
             st.caption(f"Inventory: {base_inv_days}d → {new_inv_days}d")
             st.caption(f"Cash tied: ${abs(cash_impact):,.0f}")
         
         test_stagnant = st.checkbox("📉 Stagnant Revenue (0% growth)")
         if test_stagnant:
-            stagnant_inputs = base_inputs.copy()
-            stagnant_inputs['price_increase'] = 0.0
-            stagnant_inputs['opex_increase'] = 0.01
-            scenarios['stagnant'] = generate_monthly_projections(stagnant_inputs, num_months, debt_params)
+            scenarios['stagnant'] = _project(base_inputs, num_months, debt_params,
+                                             price_increase=0.0, opex_increase=0.01)
             
-            if scenarios['stagnant']['fcf'].sum() < scenarios['base']['fcf'].sum():
+            if scenarios['stagnant']['fcf'].to_numpy().sum() < scenarios['base']['fcf'].to_numpy().sum():
                 st.caption("⚠️ FCF declines")
     
     return scenarios
@@ -905,15 +984,15 @@ def render_debt_scenarios(scenarios, base_inputs, num_months, debt_params):
     
     test_higher = st.checkbox("📈 Higher Debt (+50%)")
     if test_higher:
-        higher_debt = debt_params.copy()
-        higher_debt['loan_amount'] = debt_params['loan_amount'] * 1.5
-        monthly_rate = higher_debt['interest_rate'] / 12
-        if monthly_rate > 0:
-            higher_debt['monthly_payment'] = higher_debt['loan_amount'] * (monthly_rate * (1 + monthly_rate)**higher_debt['term_months']) / ((1 + monthly_rate)**higher_debt['term_months'] - 1)
-        else:
-            higher_debt['monthly_payment'] = higher_debt['loan_amount'] / higher_debt['term_months']
+        higher_debt = {
+            **debt_params,
+            'loan_amount': debt_params['loan_amount'] * 1.5,
+            'monthly_payment': _monthly_payments(
+                debt_params['loan_amount'], debt_params['interest_rate'], debt_params['term_months']
+            )[1.5]
+        }
         
-        scenarios['higher_debt'] = generate_monthly_projections(base_inputs, num_months, higher_debt)
+        scenarios['higher_debt'] = _projections(base_inputs, num_months, higher_debt)
         st.caption(f"Amount: ${higher_debt['loan_amount']:,.0f}")
         st.caption(f"Payment: ${higher_debt['monthly_payment']:,.0f}/mo")
     
@@ -921,43 +1000,36 @@ def render_debt_scenarios(scenarios, base_inputs, num_months, debt_params):
 
 
 
-def render_scenario_comparison(scenarios):
+def render_scenario_comparison(scenarios, summary):
     """Compare scenarios."""
     st.markdown("---")
     st.subheader("📋 Scenario Comparison")
     
-    base_cash = scenarios['base']['cash_balance'].iloc[-1]
-    base_ccc = scenarios['base']['ccc'].iloc[0]
-    base_fcf = scenarios['base']['fcf'].sum()
-    
-    data = []
-    
-    labels = {
-        'base': 'Base', 'aggressive': 'Aggressive WC', 'conservative': 'Conservative WC',
-        'custom': 'Custom WC', 'growth': f"Growth ({st.session_state.get('selected_growth_rate', 'N/A')})", 
-        'delay': 'Payment Delays',
-        'inflation': 'Cost Inflation', 'excess_inv': 'Excess Inventory',
-        'stagnant': 'Stagnant Revenue', 'higher_debt': 'Higher Debt (+50%)',
-        'growth_debt': 'Growth + Debt (5%/mo)'
-    }
+    growth_label = f"Growth ({st.session_state.get('selected_growth_rate', 'N/A')})"
+    labels = {name: growth_label if name == 'growth' else _SCENARIO_LABELS.get(name, name)
+              for name in scenarios}
+    
+    # One row per scenario: first/final month values and FCF totals
+    firsts = pd.DataFrame({name: agg['first'] for name, agg in summary.items()}).T
+    finals = pd.DataFrame({name: agg['final'] for name, agg in summary.items()}).T
+    fcf_sum = pd.Series({name: agg['fcf_sum'] for name, agg in summary.items()})
+    
+    table = pd.DataFrame({
+        'Scenario': list(labels.values()),
+        'CCC': firsts['ccc'],
+        'vs Base': firsts['ccc'] - firsts.at['base', 'ccc'],
+        'Final Cash': finals['cash_balance'],
+        'vs Base ': finals['cash_balance'] - finals.at['base', 'cash_balance'],
+        'Total FCF': fcf_sum,
+        'vs Base  ': fcf_sum - fcf_sum['base']
+    })
+    table.loc['base', ['vs Base', 'vs Base ', 'vs Base  ']] = np.nan
     
-    for name, df in scenarios.items():
-        final = df.iloc[-1]
-        cash_vs = final['cash_balance'] - base_cash
-        ccc_vs = df['ccc'].iloc[0] - base_ccc
-        fcf_vs = df['fcf'].sum() - base_fcf
-        
-        data.append({
-            'Scenario': labels.get(name, name),
-            'CCC': f"{df['ccc'].iloc[0]:.0f}d",
-            'vs Base': f"{ccc_vs:+.0f}d" if name != 'base' else '-',
-            'Final Cash': f"${final['cash_balance']:,.0f}",
-            'vs Base ': f"${cash_vs:+,.0f}" if name != 'base' else '-',
-            'Total FCF': f"${df['fcf'].sum():,.0f}",
-            'vs Base  ': f"${fcf_vs:+,.0f}" if name != 'base' else '-'
-        })
-    
-    st.dataframe(pd.DataFrame(data), width="stretch", hide_index=True)
+    st.dataframe(table.style.format({
+        'CCC': '{:.0f}d', 'vs Base': '{:+.0f}d',
+        'Final Cash': '${:,.0f}', 'vs Base ': '${:+,.0f}',
+        'Total FCF': '${:,.0f}', 'vs Base  ': '${:+,.0f}'
+    }, na_rep='-'), width="stretch", hide_index=True)
     
     # Debug Mode
     if st.session_state.get('debug_mode', False):
@@ -965,34 +1037,41 @@ def render_scenario_comparison(scenarios):
         st.subheader("🔧 Debug: Detailed Tables")
         
         for name, df in scenarios.items():
-            with st.expander(f"📊 {labels.get(name, name)} Data"):
+            with st.expander(f"📊 {labels[name]} Data"):
                 st.dataframe(df, width="stretch", hide_index=True)
 
 
-def render_visualizations(scenarios):
+def render_visualizations(scenarios, summary):
     """Core charts."""
     st.markdown("---")
     st.subheader("📊 Visual Evidence")
     
     # Check if debt exists in any scenario
-    has_debt = any(df['dscr'].sum() > 0 for df in scenarios.values())
+    has_debt = any(agg['dscr_sum'] > 0 for agg in summary.values())
+    
+    # Chart builders are cached, so pass session-dependent options explicitly
+    inputs = st.session_state['user_inputs']
+    highlight_growth = st.session_state.get('active_scenario_type') == 'Growth Rates'
+    
+    # Time-series charts start at Month 1; rows are ordered by month so a positional view suffices
+    plot_scenarios = {name: df.iloc[1:] for name, df in scenarios.items()}
     
     if has_debt:
         # Show 3 charts in row 1
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.plotly_chart(create_line_chart(scenarios, 'fcf', 'Free Cash Flow'), 
+            st.plotly_chart(create_line_chart(plot_scenarios, 'fcf', 'Free Cash Flow', highlight_growth=highlight_growth), 
                            width="stretch", key='fcf_chart')
             st.caption("💡 Negative = burning | Positive = generating")
         
         with col2:
-            st.plotly_chart(create_line_chart(scenarios, 'cash_balance', 'Cash Balance'), 
+            st.plotly_chart(create_line_chart(plot_scenarios, 'cash_balance', 'Cash Balance', highlight_growth=highlight_growth), 
                            width="stretch", key='cash_chart')
             st.caption("💡 Goes negative = need funding")
         
         with col3:
-            st.plotly_chart(create_dscr_chart(scenarios), 
+            st.plotly_chart(create_dscr_chart(plot_scenarios), 
                            width="stretch", key='dscr_chart')
             st.caption("💡 DSCR = FCF / Debt Payments | >1.25 = Healthy | 1.0-1.25 = Tight | <1.0 = Stressed")
     else:
@@ -1000,12 +1079,12 @@ def render_visualizations(scenarios):
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(create_line_chart(scenarios, 'fcf', 'Free Cash Flow'), 
+            st.plotly_chart(create_line_chart(plot_scenarios, 'fcf', 'Free Cash Flow', highlight_growth=highlight_growth), 
                            width="stretch", key='fcf_chart')
             st.caption("💡 Negative = burning | Positive = generating")
         
         with col2:
-            st.plotly_chart(create_line_chart(scenarios, 'cash_balance', 'Cash Balance'), 
+            st.plotly_chart(create_line_chart(plot_scenarios, 'cash_balance', 'Cash Balance', highlight_growth=highlight_growth), 
                            width="stretch", key='cash_chart')
             st.caption("💡 Goes negative = need funding")
     
@@ -1013,12 +1092,12 @@ def render_visualizations(scenarios):
     col3, col4 = st.columns(2)
     
     with col3:
-        st.plotly_chart(create_line_chart(scenarios, 'wc', 'Working Capital'), 
+        st.plotly_chart(create_line_chart(plot_scenarios, 'wc', 'Working Capital', highlight_growth=highlight_growth), 
                        width="stretch", key='wc_chart')
         st.caption("💡 Capital tied in operations")
     
     with col4:
-        st.plotly_chart(create_line_chart(scenarios, 'ccc', 'CCC (days)', False), 
+        st.plotly_chart(create_line_chart(plot_scenarios, 'ccc', 'CCC (days)', False, highlight_growth=highlight_growth), 
                        width="stretch", key='ccc_chart')
         st.caption("💡 Lower = faster conversion")
     
@@ -1031,23 +1110,23 @@ def render_visualizations(scenarios):
         col5, col6 = st.columns(2)
         with col5:
             st.markdown("**Base**")
-            st.plotly_chart(create_waterfall(scenarios['base']), 
+            st.plotly_chart(create_waterfall(scenarios['base'], inputs['depreciation'], inputs['capex']), 
                           width="stretch", key='waterfall_base')
         with col6:
             st.markdown(f"**{compare_scenario.capitalize()}**")
-            st.plotly_chart(create_waterfall(scenarios[compare_scenario]), 
+            st.plotly_chart(create_waterfall(scenarios[compare_scenario], inputs['depreciation'], inputs['capex']), 
                           width="stretch", key='waterfall_compare')
     else:
-        st.plotly_chart(create_waterfall(scenarios['base']), 
+        st.plotly_chart(create_waterfall(scenarios['base'], inputs['depreciation'], inputs['capex']), 
                        width="stretch", key='waterfall_single')
 
 
-def render_wc_breakdown(scenarios):
+def render_wc_breakdown(scenarios, summary):
     """Show WC breakdown for Base and selected scenario."""
     base = scenarios['base']
     
     # Check if there's variation
-    if base['delta_wc'].std() < 100:
+    if summary['base']['delta_wc_std'] < 100:
         st.markdown("---")
         st.info("💡 Enable Growth scenario to see Working Capital changes over time")
         return
@@ -1065,18 +1144,18 @@ def render_wc_breakdown(scenarios):
         
         with col1:
             st.markdown("**Base Scenario**")
-            fig_base = create_wc_breakdown_chart(base)
+            fig_base = create_wc_breakdown_chart(base.iloc[1:])
             st.plotly_chart(fig_base, width="stretch", key='wc_breakdown_base')
         
         with col2:
             st.markdown(f"**{selected_key.replace('_', ' ').title()} Scenario**")
-            fig_selected = create_wc_breakdown_chart(selected)
+            fig_selected = create_wc_breakdown_chart(selected.iloc[1:])
             st.plotly_chart(fig_selected, width="stretch", key='wc_breakdown_selected')
         
         st.caption("💡 Red = consumed | Green = released | Growth drives consumption")
     else:
         # Just base
-        fig = create_wc_breakdown_chart(base)
+        fig = create_wc_breakdown_chart(base.iloc[1:])
         st.plotly_chart(fig, width="stretch", key='wc_breakdown')
         st.caption("💡 Red = consumed | Green = released | Growth drives consumption")
 
@@ -1102,13 +1181,7 @@ def render_export(scenarios):
     #warning at Export
     st.warning("⚠️ **Reminder**: Educational estimates only. Best practice is to assume results may be inaccurate. Verify all calculations independently and consult qualified professionals before making financial decisions.")
 
-    export_df = pd.DataFrame()
-    for name, df in scenarios.items():
-        df_copy = df.copy()
-        df_copy['scenario'] = name
-        export_df = pd.concat([export_df, df_copy], ignore_index=True)
-    
-    csv = export_df.to_csv(index=False)
+    csv = _export_csv(scenarios)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
     
     st.download_button(
@@ -1120,32 +1193,86 @@ def render_export(scenarios):
     )
 
 
-def create_line_chart(scenarios, metric, title, is_currency=True):
-    """Line chart."""
-    fig = go.Figure()
+# Cheap, content-based cache key for projection frames passed to chart builders.
+# Builders use cache_resource, so every hit returns the same Figure: callers must not mutate it.
+_FRAME_HASH = {pd.DataFrame: lambda df: (tuple(df.columns), df.to_numpy().tobytes())}
+
+
+@st.cache_data(show_spinner=False, max_entries=64, hash_funcs=_FRAME_HASH)
+def _export_csv(scenarios):
+    """Serialize all scenarios to one CSV, tagged by scenario name."""
+    parts = [df.assign(scenario=name) for name, df in scenarios.items()]
+    export_df = pd.concat(parts, ignore_index=True)
     
-    colors = {
-        'base': '#1f77b4', 'aggressive': '#2ca02c', 'conservative': '#ff7f0e',
-        'custom': '#9467bd', 'growth': '#d62728', 'delay': '#8c564b',
-        'inflation': '#e377c2', 'excess_inv': '#7f7f7f', 'stagnant': '#bcbd22',
-        'higher_debt': '#e377c2', 'growth_debt': '#d62728'
-    }
+    # Write straight to bytes rather than building a str and encoding it
+    buf = io.BytesIO()
+    export_df.to_csv(buf, index=False, encoding='utf-8', chunksize=10_000)
+    return buf.getvalue()
+
+
+def _lttb_indices(x, y, max_points=500):
+    """
+    Largest-Triangle-Three-Buckets point selection.
+
+    Returns indices of the points to keep (all of them when there are
+    already max_points or fewer).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+
+    # First and last points are always kept; interior split into buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    keep = [0]
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        prev_x, prev_y = x[keep[-1]], y[keep[-1]]
+
+        # Keep the point forming the largest triangle with previous pick and next bucket average
+        area = np.abs((prev_x - avg_x) * (y[lo:hi] - prev_y) - (prev_x - x[lo:hi]) * (avg_y - prev_y))
+        keep.append(lo + int(area.argmax()))
+    keep.append(n - 1)
+
+    return np.array(keep)
+
+
+def _downsample(x, y, max_points=500):
+    """
+    LTTB-downsample a line trace.
+
+    Returns (x, y) unchanged when there are already max_points or fewer.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= max_points:
+        return x, y
+    keep = _lttb_indices(x, y, max_points)
+    return x[keep], y[keep]
+
+
+@st.cache_resource(show_spinner=False, max_entries=64, hash_funcs=_FRAME_HASH)
+def create_line_chart(scenarios, metric, title, is_currency=True, highlight_growth=False):
+    """Line chart (frames start at Month 1)."""
+    fig = go.Figure()
     
     for name, df in scenarios.items():
-        if name in colors:
-            # Filter out Month 0, start at Month 1
-            df_plot = df[df['month'] > 0].copy()
-            
+        if name in _SCENARIO_COLORS:
             # Highlight growth scenario if it's the active one
-            is_growth_selected = (name == 'growth' and 
-                                st.session_state.get('active_scenario_type') == 'Growth Rates')
+            is_growth_selected = name == 'growth' and highlight_growth
             
-            fig.add_trace(go.Scatter(
-                x=df_plot['month'], y=df_plot[metric],
+            x, y = _downsample(df['month'], df[metric])
+            
+            fig.add_trace(go.Scattergl(
+                x=x, y=y,
                 mode='lines+markers',
                 name=name.replace('_', ' ').title(),
                 line=dict(
-                    color=colors[name], 
+                    color=_SCENARIO_COLORS[name], 
                     width=4 if is_growth_selected else 2.5,
                     dash='solid' if not is_growth_selected else 'solid'
                 ),
@@ -1168,17 +1295,16 @@ def create_line_chart(scenarios, metric, title, is_currency=True):
     return fig
 
 
-def create_waterfall(df):
+def create_waterfall(df, depr, capex):
     """EBIT to FCF waterfall."""
     final = df.iloc[-1]
-    inputs = st.session_state['user_inputs']
-    
-    ebit_tax = final['ebit_after_tax']
-    depr = inputs['depreciation']
-    capex = inputs['capex']
-    dwc = final['delta_wc']
-    fcf = final['fcf']
-    
+    return _waterfall_cached(float(final['ebit_after_tax']), depr, capex,
+                             float(final['delta_wc']), float(final['fcf']))
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _waterfall_cached(ebit_tax, depr, capex, dwc, fcf):
+    """Waterfall figure keyed on its five bar values."""
     fig = go.Figure(go.Waterfall(
         x=['EBIT<br>(After Tax)', '+Depr', '-CapEx', '-ΔWC', 'FCF'],
         y=[ebit_tax, depr, -capex, -dwc, fcf],
@@ -1196,34 +1322,20 @@ def create_waterfall(df):
     return fig
 
 
+@st.cache_resource(show_spinner=False, max_entries=64, hash_funcs=_FRAME_HASH)
 def create_dscr_chart(scenarios):
-    """DSCR line chart."""
+    """DSCR line chart (frames start at Month 1)."""
     fig = go.Figure()
     
-    colors = {
-        'base': '#1f77b4', 
-        'aggressive': '#2ca02c', 
-        'conservative': '#ff7f0e',
-        'custom': '#9467bd', 
-        'growth': '#d62728', 
-        'delay': '#8c564b',
-        'inflation': '#e377c2', 
-        'excess_inv': '#7f7f7f', 
-        'stagnant': '#bcbd22',
-        'higher_debt': '#e377c2', 
-        'growth_debt': '#d62728'
-    }
-    
     for name, df in scenarios.items():
-        if df['dscr'].sum() > 0:  # Only show scenarios with debt
-            # Filter out Month 0, start at Month 1
-            df_plot = df[df['month'] > 0].copy()
+        if df['dscr'].to_numpy().sum() > 0:  # Only show scenarios with debt
+            x, y = _downsample(df['month'], df['dscr'])
             
-            fig.add_trace(go.Scatter(
-                x=df_plot['month'], y=df_plot['dscr'],
+            fig.add_trace(go.Scattergl(
+                x=x, y=y,
                 mode='lines+markers',
                 name=name.replace('_', ' ').title(),
-                line=dict(color=colors.get(name, '#999999'), width=2.5),
+                line=dict(color=_SCENARIO_COLORS.get(name, '#999999'), width=2.5),
                 marker=dict(size=6)
             ))
     
@@ -1247,27 +1359,32 @@ def create_dscr_chart(scenarios):
     return fig
 
 
+@st.cache_resource(show_spinner=False, max_entries=64, hash_funcs=_FRAME_HASH)
 def create_wc_breakdown_chart(df):
-    """Working capital breakdown chart."""
-    # Filter out Month 0, start at Month 1
-    df_plot = df[df['month'] > 0].copy()
+    """Working capital breakdown chart (frame starts at Month 1)."""
+    # Stacked bars share one set of months, picked from the net ΔWC series
+    keep = _lttb_indices(df['month'], df['delta_wc'])
+    df_plot = df.iloc[keep]
+    
+    # One x array shared by all three traces
+    x = df_plot['month'].to_numpy()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=df_plot['month'], y=df_plot['delta_ar'],
+        x=x, y=df_plot['delta_ar'].to_numpy(),
         name='ΔAR (Tied in Receivables)',
         marker_color='#E74C3C'
     ))
     
     fig.add_trace(go.Bar(
-        x=df_plot['month'], y=df_plot['delta_inventory'],
+        x=x, y=df_plot['delta_inventory'].to_numpy(),
         name='ΔInventory (Tied in Stock)',
         marker_color='#E67E22'
     ))
     
     fig.add_trace(go.Bar(
-        x=df_plot['month'], y=-df_plot['delta_ap'],
+        x=x, y=-df_plot['delta_ap'].to_numpy(),
         name='ΔAP (Released from Delays)',
         marker_color='#27AE60'
     ))
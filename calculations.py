@@ -2,12 +2,14 @@
 calculations.py
 """
 
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
 
 def calculate_wc_components(revenue, cogs_pct, ar_days, ap_days, inventory_days):
-    """Calculate dollar amounts for AR, Inventory, and AP based on days."""
+    """Calculate dollar amounts for AR, Inventory, and AP based on days, as (ar, inventory, ap)."""
     cogs = revenue * cogs_pct
     
     # Note: Uses 30-day month convention (360-day year) standard in corporate finance.
@@ -15,7 +17,7 @@ def calculate_wc_components(revenue, cogs_pct, ar_days, ap_days, inventory_days)
     inventory = (cogs / 30) * inventory_days
     ap = (cogs / 30) * ap_days
     
-    return {'ar': ar, 'inventory': inventory, 'ap': ap}
+    return ar, inventory, ap
 
 
 def calculate_ebit(revenue, cogs_pct, opex):
@@ -43,273 +45,303 @@ def calculate_fcf(ebit, tax_rate, depreciation, capex, delta_wc):
     fcf = nopat + depreciation - capex - delta_wc
     return fcf
 
+def calculate_monthly_payment(loan_amount, interest_rate, term_months):
+    """
+    Level monthly payment that amortizes loan_amount over term_months.
+    
+    Accepts scalars or broadcastable arrays; 0% interest falls back to straight-line repayment.
+    """
+    monthly_rate = np.asarray(interest_rate, dtype=float) / 12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = (1 + monthly_rate) ** term_months
+        payment = np.where(monthly_rate > 0,
+                           loan_amount * monthly_rate * factor / (factor - 1),
+                           loan_amount / term_months)
+    return payment[()]
+
+
 # Note: Uses present value (PV) formula to calculate remaining balance independently each month.
 # This approach prioritizes code simplicity and readability for educational purposes.
-def calculate_debt_service(debt_params, month):
+def build_debt_schedule(debt_params, num_months):
     """
-    Calculate monthly debt service (interest + principal).
+    Calculate monthly debt service (interest + principal) for months 0..num_months.
     
-    Returns dict with:
-    - interest_expense: Monthly interest payment
-    - principal_payment: Monthly principal payment
-    - remaining_balance: Remaining loan balance
+    Returns tuple of arrays (interest_expense, principal_payment, remaining_balance):
+    - month 0 has no payment and carries the opening loan balance
+    - months after the loan term are zero
+    - columns that never accrue (all of them without a loan, interest at 0%) stay integer zeros
     """
-    if debt_params is None or month > debt_params['term_months']:
-        return {'interest_expense': 0, 'principal_payment': 0, 'remaining_balance': 0}
+    interest = np.zeros(num_months + 1, dtype=int)
+    if debt_params is None:
+        return interest, interest.copy(), interest.copy()
+    principal = np.zeros(num_months + 1)
+    balance = np.zeros(num_months + 1)
     
-    # Calculate remaining balance
+    loan_amount = debt_params['loan_amount']
+    payment = debt_params['monthly_payment']
     monthly_rate = debt_params['interest_rate'] / 12
-    months_remaining = debt_params['term_months'] - month + 1
+    term_months = int(debt_params['term_months'])
+    balance[0] = loan_amount
     
-    if months_remaining <= 0:
-        return {'interest_expense': 0, 'principal_payment': 0, 'remaining_balance': 0}
+    # Months with a payment due
+    k = np.arange(1, min(num_months, term_months) + 1)
     
     # Handle 0% interest case
     if monthly_rate == 0:
-        remaining_balance = debt_params['loan_amount'] - (debt_params['monthly_payment'] * (month - 1))
-        interest_expense = 0
-        principal_payment = debt_params['monthly_payment']
-        
-        return {
-            'interest_expense': interest_expense,
-            'principal_payment': principal_payment,
-            'remaining_balance': max(0, remaining_balance)
-        }
+        balance[k] = np.maximum(0, loan_amount - payment * (k - 1))
+        principal[k] = payment
+        return interest, principal, balance
     
-    # Standard amortization with interest
-    # Remaining balance formula
-    remaining_balance = debt_params['monthly_payment'] * ((1 - (1 + monthly_rate)**(-months_remaining)) / monthly_rate)
+    # Standard amortization: remaining balance from PV of remaining payments
+    months_remaining = term_months - k + 1
+    balance[k] = payment * ((1 - (1 + monthly_rate) ** (-months_remaining)) / monthly_rate)
     
-    # Interest for this month
-    prev_balance = debt_params['monthly_payment'] * ((1 - (1 + monthly_rate)**(-(months_remaining + 1))) / monthly_rate) if month > 1 else debt_params['loan_amount']
-    interest_expense = prev_balance * monthly_rate
+    # Interest accrues on the prior month's balance (the loan amount in month 1)
+    prev_balance = np.concatenate(([loan_amount], balance[k]))[:len(k)]
+    interest = np.zeros(num_months + 1)
+    interest[k] = prev_balance * monthly_rate
+    principal[k] = payment - interest[k]
+    
+    return interest, principal, balance
+
+
+# WC scenario adjustments: (AR days delta, AP days delta, inventory days multiplier)
+_SCENARIO_ADJ = {
+    'base': (0, 0, 1.0),
+    'conservative': (+10, -5, 1.15),
+    'aggressive': (-10, +10, 0.85),
+}
+
+
+def apply_scenario_adjustments(base_inputs, scenario_type):
+    """Apply scenario adjustments to base inputs."""
+    adjustments = _SCENARIO_ADJ.get(scenario_type, _SCENARIO_ADJ['base'])
     
-    # Principal = Total payment - Interest
-    principal_payment = debt_params['monthly_payment'] - interest_expense
+    # Base (and unknown) scenarios return the inputs unchanged, keeping int day counts
+    if adjustments == _SCENARIO_ADJ['base']:
+        return {**base_inputs}
     
+    ar_delta, ap_delta, inv_multiplier = adjustments
     return {
-        'interest_expense': interest_expense,
-        'principal_payment': principal_payment,
-        'remaining_balance': remaining_balance
+        **base_inputs,
+        'ar_days': max(0, base_inputs['ar_days'] + ar_delta),
+        'ap_days': max(0, base_inputs['ap_days'] + ap_delta),
+        'inventory_days': base_inputs['inventory_days'] * inv_multiplier
     }
 
 
-def calculate_tier1_metrics(revenue, ebit, ar, inventory, ap, cash_balance, opex):
+_PROJECTION_COLUMNS = (
+    'month', 'revenue', 'cogs', 'ebit', 'interest_expense', 'ebit_after_interest', 'ebit_after_tax',
+    'ar', 'inventory', 'ap', 'wc', 'delta_wc', 'delta_ar', 'delta_inventory', 'delta_ap',
+    'fcf', 'principal_payment', 'fcf_after_debt', 'debt_balance', 'dscr', 'cash_balance',
+    'ccc', 'gross_margin', 'current_ratio', 'quick_ratio', 'days_cash_on_hand', 'operating_margin'
+)
+
+
+def _growth_factors(rate, num_months):
+    """Compound growth factors (1 + rate)**month for months 0..num_months, as a running product."""
+    rate = np.asarray(rate, dtype=float)
+    multipliers = np.empty(np.broadcast_shapes(rate.shape, (num_months + 1,)))
+    multipliers[...] = 1 + rate
+    multipliers[..., 0] = 1
+    return np.cumprod(multipliers, axis=-1)
+
+
+def _guarded_divide(numerator, denominator, where):
+    """Elementwise numerator / denominator, 0 wherever the guard is False (no divide warnings)."""
+    shape = np.broadcast_shapes(np.shape(numerator), np.shape(denominator), np.shape(where))
+    return np.divide(numerator, denominator, out=np.zeros(shape), where=where)
+
+
+def _month_change(values):
+    """Month-over-month change along the last axis (zero in month 0)."""
+    return np.diff(values, axis=-1, prepend=values[..., :1])
+
+
+def _project_core(revenue0, growth, cogs_pct0, cogs_growth, opex0, opex_growth,
+                  ar_days, ap_days, inventory_days, tax_rate, capex, depreciation,
+                  opening_cash, interest, principal, debt_balance, num_months):
     """
-    Calculate Tier 1 financial metrics.
+    Monthly projections as whole-horizon array operations.
     
-    Returns dict with:
-    - current_ratio: Current Assets / Current Liabilities
-    - quick_ratio: (Current Assets - Inventory) / Current Liabilities
-    - days_cash_on_hand: Cash Balance / (OPEX per day)
-    - operating_margin: EBIT / Revenue
+    interest, principal and debt_balance are per-month debt schedules of
+    length num_months + 1. Inputs broadcast against the month axis (last axis),
+    so e.g. growth of shape (k, 1) projects k rates at once.
+    Returns dict of column arrays in _PROJECTION_COLUMNS order.
     """
-    current_assets = ar + inventory + cash_balance
-    current_liabilities = ap if ap > 0 else 1  # Avoid division by zero
+    months = np.arange(num_months + 1)
+    
+    # Compound growth for price, COGS% (capped at 95%) and OPEX
+    revenue = revenue0 * _growth_factors(growth, num_months)
+    cogs_pct = np.minimum(cogs_pct0 * _growth_factors(cogs_growth, num_months), 0.95)
+    opex = opex0 * _growth_factors(opex_growth, num_months)
+    cogs = revenue * cogs_pct
+    
+    # EBIT before and after interest (reusing COGS rather than recomputing it in calculate_ebit)
+    ebit = revenue - cogs - opex
+    ebit_after_interest = ebit - interest
+    
+    # WC components on the 30-day month convention (same as calculate_wc_components)
+    ar = (revenue / 30) * ar_days
+    inventory = (cogs / 30) * inventory_days
+    ap = (cogs / 30) * ap_days
+    wc = (ar + inventory) - ap
+    
+    # Month 0 represents baseline/current state - business already operating at steady state.
+    # No working capital change occurs in Month 0 as it's a snapshot, not a projection period.
+    # ΔWC calculations begin in Month 1 when comparing against this baseline.
+    delta_wc = _month_change(wc)
+    
+    # FCF before and after debt principal; cash accumulates from Month 1
+    fcf = calculate_fcf(ebit_after_interest, tax_rate, depreciation, capex, delta_wc)
+    fcf_after_debt = fcf - principal
+    cash_balance = opening_cash + np.cumsum(np.where(months > 0, fcf_after_debt, 0), axis=-1)
     
+    # Tier 1 metrics:
+    # - current_ratio: Current Assets / Current Liabilities
+    # - quick_ratio: (Current Assets - Inventory) / Current Liabilities
+    # - days_cash_on_hand: Cash Balance / (OPEX per day)
+    # - operating_margin: EBIT / Revenue
+    current_assets = ar + inventory + cash_balance
+    current_liabilities = np.where(ap > 0, ap, 1)  # Avoid division by zero
     current_ratio = current_assets / current_liabilities
     quick_ratio = (current_assets - inventory) / current_liabilities
-    days_cash_on_hand = (cash_balance / (opex / 30)) if opex > 0 else 0
-    operating_margin = (ebit / revenue * 100) if revenue > 0 else 0
     
-    return {
+    # DSCR where debt service is due (none in month 0)
+    debt_service = interest + principal
+    days_cash_on_hand = _guarded_divide(cash_balance, opex / 30, opex > 0)
+    operating_margin = _guarded_divide(ebit, revenue, revenue > 0) * 100
+    dscr = (_guarded_divide(fcf, debt_service, debt_service > 0) if debt_service.any()
+            else np.zeros_like(debt_service))
+    gross_margin = _guarded_divide(revenue - cogs, revenue, revenue > 0) * 100
+    
+    cols = {
+        'month': months,
+        'revenue': revenue,
+        'cogs': cogs,
+        'ebit': ebit,
+        'interest_expense': interest,
+        'ebit_after_interest': ebit_after_interest,
+        'ebit_after_tax': ebit_after_interest * (1 - tax_rate),
+        'ar': ar,
+        'inventory': inventory,
+        'ap': ap,
+        'wc': wc,
+        'delta_wc': delta_wc,
+        'delta_ar': _month_change(ar),
+        'delta_inventory': _month_change(inventory),
+        'delta_ap': _month_change(ap),
+        'fcf': fcf,
+        'principal_payment': principal,
+        'fcf_after_debt': fcf_after_debt,
+        'debt_balance': debt_balance,
+        'dscr': dscr,
+        'cash_balance': cash_balance,
+        'ccc': ar_days + inventory_days - ap_days,
+        'gross_margin': gross_margin,
         'current_ratio': current_ratio,
         'quick_ratio': quick_ratio,
         'days_cash_on_hand': days_cash_on_hand,
         'operating_margin': operating_margin
     }
+    
+    # Expand every column to the common (..., months) shape
+    shape = np.broadcast_shapes(*(np.shape(values) for values in cols.values()))
+    return {name: np.broadcast_to(values, shape) for name, values in cols.items()}
 
 
-def apply_scenario_adjustments(base_inputs, scenario_type):
-    """Apply scenario adjustments to base inputs."""
-    adjusted = base_inputs.copy()
-    
-    if scenario_type == 'base':
-        return adjusted
-    
-    elif scenario_type == 'conservative':
-        adjusted['ar_days'] = base_inputs['ar_days'] + 10
-        adjusted['ap_days'] = max(0, base_inputs['ap_days'] - 5)
-        adjusted['inventory_days'] = base_inputs['inventory_days'] * 1.15
-        
-    elif scenario_type == 'aggressive':
-        adjusted['ar_days'] = max(0, base_inputs['ar_days'] - 10)
-        adjusted['ap_days'] = base_inputs['ap_days'] + 10
-        adjusted['inventory_days'] = base_inputs['inventory_days'] * 0.85
+def _project_columns(inputs, num_months, debt_params=None):
+    """Unpack an inputs dict (values may be broadcastable arrays) and run _project_core."""
+    interest, principal, debt_balance = build_debt_schedule(debt_params, num_months)
     
-    return adjusted
+    return _project_core(
+        inputs['revenue'], inputs.get('price_increase', 0),
+        inputs['cogs_pct'], inputs.get('cogs_increase', 0),
+        inputs['opex'], inputs.get('opex_increase', 0),
+        inputs['ar_days'], inputs['ap_days'], inputs['inventory_days'],
+        inputs['tax_rate'], inputs['capex'], inputs['depreciation'],
+        inputs.get('opening_cash', 0), interest, principal, debt_balance, num_months
+    )
 
 
-def generate_monthly_projections(inputs, num_months, debt_params=None):
-    """Generate monthly financial projections with optional debt modeling."""
-    results = []
-    
-    # Get base values and increase rates
-    base_revenue = inputs['revenue']
-    price_increase = inputs.get('price_increase', 0)
-    
-    base_cogs_pct = inputs['cogs_pct']
-    cogs_increase = inputs.get('cogs_increase', 0)
+def generate_monthly_projections(inputs, num_months, debt_params=None, dtype=np.float64):
+    """
+    Generate monthly financial projections with optional debt modeling.
     
-    base_opex = inputs['opex']
-    opex_increase = inputs.get('opex_increase', 0)
+    Math always runs in float64; dtype only sets storage of the returned columns,
+    e.g. np.float32 halves memory for frames that are held or batched (month is then
+    stored as int32). The UI keeps the float64 default: float32 shifts displayed totals.
+    """
+    cols = _project_columns(inputs, num_months, debt_params)
+    if np.dtype(dtype) != np.float64:
+        cols = {name: values.astype(np.int32 if name == 'month' else dtype) for name, values in cols.items()}
+    return pd.DataFrame(cols)
+
+
+def project_grid(inputs, num_months, rates, debt_params=None):
+    """
+    Project cash balance for many revenue growth rates in one vectorized pass.
+
+    Returns array of shape (len(rates), num_months + 1):
+    - one row per growth rate (overrides inputs['price_increase'])
+    - column index equals the month number, matching generate_monthly_projections
+    """
+    rates = np.asarray(rates, dtype=float)[:, None]
+    cols = _project_columns({**inputs, 'price_increase': rates}, num_months, debt_params)
+    return cols['cash_balance']
+
+
+_COMPARISON_SCENARIOS = ('base', 'conservative', 'aggressive')
+
+
+@lru_cache(maxsize=128)
+def _scenario_columns(inputs_key, num_months, debt_key):
+    """
+    Batched (3, num_months + 1) column arrays for the comparison scenarios.
     
-    # Initialize with steady-state WC (business already operating)
-    initial_wc = calculate_wc_components(base_revenue, base_cogs_pct,
-                                        inputs['ar_days'], inputs['ap_days'], inputs['inventory_days'])
-    wc_previous = calculate_working_capital(initial_wc['ar'], initial_wc['inventory'], initial_wc['ap'])
-    ar_previous = initial_wc['ar']
-    inventory_previous = initial_wc['inventory']
-    ap_previous = initial_wc['ap']
+    Memoized on frozen inputs; returned arrays are shared between callers and read-only.
+    """
+    base_inputs = dict(inputs_key)
+    debt_params = dict(debt_key) if debt_key is not None else None
+    adjusted = [apply_scenario_adjustments(base_inputs, scenario_type) for scenario_type in _COMPARISON_SCENARIOS]
     
-    # Track cash balance
-    opening_cash = inputs.get('opening_cash', 0)
-    cash_balance = opening_cash
+    # Scenarios differ only in WC days: stack them as (3, 1) columns and project all at once
+    stacked = {**base_inputs}
+    for key in ('ar_days', 'ap_days', 'inventory_days'):
+        stacked[key] = np.array([inputs[key] for inputs in adjusted])[:, None]
+    cols = _project_columns(stacked, num_months, debt_params)
     
-    # Generate Month 0 (current/baseline) through Month num_months
-    for month in range(0, num_months + 1):
-        # Apply price increase (compound growth)
-        current_revenue = base_revenue * ((1 + price_increase) ** month)
-        
-        # Apply COGS% increase (compound growth)
-        current_cogs_pct = base_cogs_pct * ((1 + cogs_increase) ** month)
-        current_cogs_pct = min(current_cogs_pct, 0.95)  # Cap at 95%
-        
-        # Apply OPEX increase (compound growth)
-        current_opex = base_opex * ((1 + opex_increase) ** month)
-        
-        # Calculate debt service if applicable (starts at month 1)
-        debt_service = calculate_debt_service(debt_params, month) if month > 0 else {
-            'interest_expense': 0, 'principal_payment': 0, 'remaining_balance': 
-            debt_params['loan_amount'] if debt_params else 0
-        }
-        
-        # Calculate EBIT (before interest)
-        ebit = calculate_ebit(current_revenue, current_cogs_pct, current_opex)
-        
-        # EBIT after interest (EBIT - Interest Expense)
-        ebit_after_interest = ebit - debt_service['interest_expense']
-        ebit_after_tax = ebit_after_interest * (1 - inputs['tax_rate'])
-        
-        # Calculate COGS for gross margin
-        cogs = current_revenue * current_cogs_pct
-        gross_margin = ((current_revenue - cogs) / current_revenue * 100) if current_revenue > 0 else 0
-        
-        # Calculate WC components
-        wc_components = calculate_wc_components(
-            current_revenue,
-            current_cogs_pct,
-            inputs['ar_days'],
-            inputs['ap_days'],
-            inputs['inventory_days']
-        )
-        
-        # Calculate WC
-        wc = calculate_working_capital(
-            wc_components['ar'],
-            wc_components['inventory'],
-            wc_components['ap']
-        )
-        
-        # Month 0 represents baseline/current state - business already operating at steady state.
-        # No working capital change occurs in Month 0 as it's a snapshot, not a projection period.
-        # ΔWC calculations begin in Month 1 when comparing against this baseline.
-        # Calculate ΔWC and component changes (zero for month 0)
-        if month == 0:
-            delta_wc = 0
-            delta_ar = 0
-            delta_inventory = 0
-            delta_ap = 0
-        else:
-            delta_wc = calculate_delta_wc(wc, wc_previous)
-            delta_ar = wc_components['ar'] - ar_previous
-            delta_inventory = wc_components['inventory'] - inventory_previous
-            delta_ap = wc_components['ap'] - ap_previous
-        
-        # Calculate FCF (before debt principal)
-        fcf = calculate_fcf(
-            ebit_after_interest,
-            inputs['tax_rate'],
-            inputs['depreciation'],
-            inputs['capex'],
-            delta_wc
-        )
-        
-        # FCF after debt service (subtract principal payment)
-        fcf_after_debt = fcf - debt_service['principal_payment']
-        
-        # Update cash balance (no change in month 0)
-        if month > 0:
-            cash_balance += fcf_after_debt
-        
-        # Calculate CCC
-        ccc = inputs['ar_days'] + inputs['inventory_days'] - inputs['ap_days']
-        
-        # Calculate Tier 1 metrics
-        tier1 = calculate_tier1_metrics(
-            current_revenue,
-            ebit,
-            wc_components['ar'],
-            wc_components['inventory'],
-            wc_components['ap'],
-            cash_balance,
-            current_opex
-        )
-        
-        # Calculate DSCR if debt exists
-        dscr = 0
-        if debt_params and month > 0 and (debt_service['interest_expense'] + debt_service['principal_payment']) > 0:
-            dscr = fcf / (debt_service['interest_expense'] + debt_service['principal_payment'])
-        
-        # Store results
-        results.append({
-            'month': month,
-            'revenue': current_revenue,
-            'cogs': cogs,
-            'ebit': ebit,
-            'interest_expense': debt_service['interest_expense'],
-            'ebit_after_interest': ebit_after_interest,
-            'ebit_after_tax': ebit_after_tax,
-            'ar': wc_components['ar'],
-            'inventory': wc_components['inventory'],
-            'ap': wc_components['ap'],
-            'wc': wc,
-            'delta_wc': delta_wc,
-            'delta_ar': delta_ar,
-            'delta_inventory': delta_inventory,
-            'delta_ap': delta_ap,
-            'fcf': fcf,
-            'principal_payment': debt_service['principal_payment'],
-            'fcf_after_debt': fcf_after_debt,
-            'debt_balance': debt_service['remaining_balance'],
-            'dscr': dscr,
-            'cash_balance': cash_balance,
-            'ccc': ccc,
-            'gross_margin': gross_margin,
-            'current_ratio': tier1['current_ratio'],
-            'quick_ratio': tier1['quick_ratio'],
-            'days_cash_on_hand': tier1['days_cash_on_hand'],
-            'operating_margin': tier1['operating_margin']
-        })
-        
-        # Update previous values
-        wc_previous = wc
-        ar_previous = wc_components['ar']
-        inventory_previous = wc_components['inventory']
-        ap_previous = wc_components['ap']
+    for values in cols.values():
+        values.flags.writeable = False
+    return cols
+
+
+def _comparison_columns(base_inputs, num_months, debt_params=None):
+    """Cached (3, num_months + 1) comparison arrays for dict inputs."""
+    debt_key = frozenset(debt_params.items()) if debt_params is not None else None
+    return _scenario_columns(frozenset(base_inputs.items()), num_months, debt_key)
+
+
+def generate_scenario_frame(base_inputs, num_months, debt_params=None):
+    """
+    Projections for all three scenarios as one long-format DataFrame.
     
-    return pd.DataFrame(results)
+    Rows are grouped by scenario (base, conservative, aggressive), each holding
+    months 0..num_months; the 'scenario' column is categorical.
+    """
+    cols = _comparison_columns(base_inputs, num_months, debt_params)
+    frame = pd.DataFrame({name: values.ravel() for name, values in cols.items()})
+    frame['scenario'] = pd.Categorical(np.repeat(_COMPARISON_SCENARIOS, num_months + 1),
+                                       categories=_COMPARISON_SCENARIOS)
+    return frame
 
 
 def generate_scenario_comparison(base_inputs, num_months, debt_params=None):
     """Generate projections for all three scenarios."""
-    scenarios = {}
-    
-    for scenario_type in ['base', 'conservative', 'aggressive']:
-        # Apply scenario adjustments
-        adjusted_inputs = apply_scenario_adjustments(base_inputs, scenario_type)
-        
-        # Generate projections (with debt if provided)
-        scenarios[scenario_type] = generate_monthly_projections(adjusted_inputs, num_months, debt_params)
+    cols = _comparison_columns(base_inputs, num_months, debt_params)
     
-    return scenarios
\ No newline at end of file
+    # One frame per scenario row; the constructor copies out of the shared, read-only cache
+    return {
+        scenario_type: pd.DataFrame({name: values[row] for name, values in cols.items()})
+        for row, scenario_type in enumerate(_COMPARISON_SCENARIOS)
+    }